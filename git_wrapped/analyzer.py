@@ -1,12 +1,22 @@
 """Git history analyzer — parses git log and computes wrapped statistics."""
 
+import hashlib
+import os
+import pickle
 import subprocess
+import sys
 import re
-from datetime import datetime, timedelta, date as date_type
-from collections import Counter, defaultdict
+from datetime import datetime, date as date_type
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain, islice
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Set
+from typing import Iterable, Iterator, List, Dict, Tuple, Optional
+
+from git_wrapped import __version__
 
 # ---------------------------------------------------------------------------
 # Language detection by file extension
@@ -53,6 +63,9 @@ EXTENSION_LANGUAGES: Dict[str, str] = {
     ".dockerfile": "Docker",
 }
 
+# Longer suffixes ("notes.2024-backup") can be rejected without lowercasing
+_MAX_EXT_LEN = max(map(len, EXTENSION_LANGUAGES))
+
 # Files that imply a language regardless of extension
 SPECIAL_FILES: Dict[str, str] = {
     "Dockerfile": "Docker",
@@ -73,9 +86,13 @@ class Commit:
     hash: str
     author: str
     email: str
-    date: datetime
+    date: str        # ISO 8601 author date as printed by git (%aI)
+    timestamp: int   # author date as Unix time, for ordering across time zones
     message: str
-    files: List[Tuple[int, int, str]] = field(default_factory=list)
+    # (insertions, deletions, path) — paths stay raw bytes, see parse_git_log
+    files: List[Tuple[int, int, bytes]] = field(default_factory=list)
+    # (files, insertions, deletions) when parsed from --shortstat instead
+    summary: Optional[Tuple[int, int, int]] = None
 
 
 @dataclass
@@ -92,10 +109,10 @@ class WrappedStats:
     active_days: int = 0
 
     # Time patterns  (hour 0‑23, weekday 0=Mon, month 1‑12)
-    commits_by_hour: Dict[int, int] = field(default_factory=lambda: defaultdict(int))
-    commits_by_weekday: Dict[int, int] = field(default_factory=lambda: defaultdict(int))
-    commits_by_month: Dict[int, int] = field(default_factory=lambda: defaultdict(int))
-    daily_counts: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    commits_by_hour: Dict[int, int] = field(default_factory=Counter)
+    commits_by_weekday: Dict[int, int] = field(default_factory=Counter)
+    commits_by_month: Dict[int, int] = field(default_factory=Counter)
+    daily_counts: Dict[str, int] = field(default_factory=Counter)
 
     # Top items
     top_files: List[Tuple[str, int]] = field(default_factory=list)
@@ -153,6 +170,44 @@ MONTH_NAMES = [
 # ---------------------------------------------------------------------------
 
 _COMMIT_PREFIX = ">>>GW:"
+_COMMIT_PREFIX_B = _COMMIT_PREFIX.encode()
+_PREFIX_LEN = len(_COMMIT_PREFIX_B)
+
+# With -z git passes paths through unquoted; shown names get git's C-style
+# escapes for control characters so a tab or newline stays on one line
+_PATH_ESCAPES: Dict[int, str] = {c: f"\\{c:03o}" for c in (*range(32), 127)}
+_PATH_ESCAPES.update({7: "\\a", 8: "\\b", 9: "\\t", 10: "\\n", 11: "\\v", 12: "\\f", 13: "\\r"})
+
+_SHORTSTAT_RE = re.compile(
+    rb"(\d+) files? changed(?:, (\d+) insertions?\(\+\))?(?:, (\d+) deletions?\(-\))?"
+)
+
+def _raise_git_error(stderr: str, cwd: str) -> None:
+    """Translate a failed git invocation into a friendly RuntimeError."""
+    stderr = stderr.strip()
+    if "not a git repository" in stderr:
+        raise RuntimeError(
+            f"'{cwd}' is not a git repository. "
+            "Run git-wrapped inside a repo or use --path."
+        )
+    raise RuntimeError(f"git error: {stderr}")
+
+
+def _run_git_stream(args: List[str], cwd: str) -> subprocess.Popen:
+    """Start a git command with binary stdout piped for incremental reading."""
+    try:
+        return subprocess.Popen(
+            ["git"] + args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=cwd,
+        )
+    except FileNotFoundError:
+        raise RuntimeError(
+            "git is not installed or not in your PATH. "
+            "Install git and try again."
+        )
+
 
 def _run_git(args: List[str], cwd: str) -> str:
     """Run a git command and return stdout."""
@@ -173,71 +228,126 @@ def _run_git(args: List[str], cwd: str) -> str:
         raise RuntimeError("git command timed out — is the repository very large?")
 
     if result.returncode != 0:
-        stderr = result.stderr.strip()
-        if "not a git repository" in stderr:
-            raise RuntimeError(
-                f"'{cwd}' is not a git repository. "
-                "Run git-wrapped inside a repo or use --path."
-            )
-        raise RuntimeError(f"git error: {stderr}")
+        _raise_git_error(result.stderr, cwd)
     return result.stdout
 
 
+def _iter_nul_tokens(stream, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+    """Yield NUL-separated tokens from a stream, splitting a block at a time."""
+    tail = b""
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        tokens = (tail + block).split(b"\x00")
+        tail = tokens.pop()
+        yield from tokens
+    if tail:
+        yield tail
+
+
 def parse_git_log(
     repo_path: str = ".",
     year: Optional[int] = None,
     author: Optional[str] = None,
+    detailed: bool = True,
 ) -> List[Commit]:
-    """Parse git log and return a list of Commit objects."""
+    """Parse git log and return a list of Commit objects.
+
+    The output is streamed from git and parsed as it arrives, so memory use
+    does not grow with the size of the raw log. Records are NUL-delimited
+    (``-z``), so paths are never quoted and may contain tabs or newlines.
+
+    Paths in ``Commit.files`` are kept as the raw bytes git printed; only
+    the handful that end up in ``WrappedStats.top_files`` are decoded.
 
-    fmt = f"{_COMMIT_PREFIX}%H%x00%an%x00%ae%x00%aI%x00%s"
-    cmd = ["log", f"--format={fmt}", "--numstat", "--no-merges"]
+    With ``detailed=False`` git is asked for ``--shortstat`` totals instead
+    of a row per file: ``Commit.summary`` is filled and ``Commit.files``
+    stays empty, which is much cheaper on large histories.
+    """
+
+    # The leading NUL keeps each header in its own token even after the
+    # newline-terminated --shortstat line
+    fmt = f"%x00{_COMMIT_PREFIX}%H%x00%an%x00%ae%x00%aI%x00%at%x00%s%x00"
+    stat_flag = "--numstat" if detailed else "--shortstat"
+    cmd = ["log", f"--format={fmt}", stat_flag, "-z", "--no-merges"]
 
     if year:
         cmd += [f"--after={year}-01-01", f"--before={year + 1}-01-01"]
     if author:
         cmd += ["--author", author]
 
-    raw = _run_git(cmd, cwd=repo_path)
-    if not raw.strip():
-        return []
-
     commits: List[Commit] = []
     current: Optional[Commit] = None
+    # One shared bytes object per distinct path: rows for the same file
+    # reuse it, so memory tracks unique paths and its hash is computed once
+    paths: Dict[bytes, bytes] = {}
+
+    with _run_git_stream(cmd, cwd=repo_path) as proc:
+        tokens = _iter_nul_tokens(proc.stdout)
+        for token in tokens:
+            if token[:_PREFIX_LEN] == _COMMIT_PREFIX_B:
+                if current is not None:
+                    commits.append(current)
+
+                header = list(islice(tokens, 5))
+                if len(header) < 5:
+                    current = None
+                    continue
+
+                name, email, datestr, timestamp, message = header
+                try:
+                    ts = int(timestamp)
+                except ValueError:
+                    current = None
+                    continue
 
-    for line in raw.splitlines():
-        if line.startswith(_COMMIT_PREFIX):
-            if current is not None:
-                commits.append(current)
+                # Decode each field once; only free text can be non-ASCII
+                current = Commit(
+                    hash=token[_PREFIX_LEN:].decode("ascii"),
+                    author=name.decode("utf-8", "replace"),
+                    email=email.decode("utf-8", "replace"),
+                    date=datestr.decode("ascii"),
+                    timestamp=ts,
+                    message=message.decode("utf-8", "replace"),
+                )
+                continue
+
+            if current is None:
+                continue
 
-            payload = line[len(_COMMIT_PREFIX):]
-            parts = payload.split("\x00", 4)
-            if len(parts) < 5:
-                current = None
+            # shortstat line: " 3 files changed, 10 insertions(+), 2 deletions(-)"
+            if not detailed:
+                match = _SHORTSTAT_RE.search(token)
+                if match:
+                    files, adds, dels = match.groups(default=b"0")
+                    current.summary = (int(files), int(adds), int(dels))
                 continue
 
-            sha, name, email, datestr, message = parts
+            # numstat entry: "10\t5\tfilename", or "10\t5\t" followed by
+            # the old and new path as two more tokens for a rename
+            if b"\t" not in token:
+                continue
+            parts = token.lstrip(b"\n").split(b"\t", 2)
+            if len(parts) != 3:
+                continue
+            fname = parts[2]
+            if not fname:
+                next(tokens, None)
+                fname = next(tokens, b"")
             try:
-                dt = datetime.fromisoformat(datestr)
+                adds = int(parts[0]) if parts[0] != b"-" else 0
+                dels = int(parts[1]) if parts[1] != b"-" else 0
             except ValueError:
-                current = None
                 continue
+            current.files.append((adds, dels, paths.setdefault(fname, fname)))
 
-            current = Commit(
-                hash=sha, author=name, email=email, date=dt, message=message
-            )
-            continue
+        # git writes little to stderr, so draining it after stdout is safe
+        stderr = proc.stderr.read().decode("utf-8", "replace")
+        returncode = proc.wait()
 
-        # numstat line: "10\t5\tfilename"
-        if current is not None and "\t" in line:
-            parts = line.split("\t", 2)
-            if len(parts) == 3:
-                try:
-                    adds = int(parts[0]) if parts[0] != "-" else 0
-                    dels = int(parts[1]) if parts[1] != "-" else 0
-                except ValueError:
-                    continue
-                current.files.append((adds, dels, parts[2]))
+    if returncode != 0:
+        _raise_git_error(stderr, repo_path)
 
     if current is not None:
         commits.append(current)
@@ -245,47 +355,147 @@ def parse_git_log(
     return commits
 
 
+def _resolve_repo_name(repo_path: str) -> str:
+    """Name the repo after its origin remote, falling back to the directory."""
+    try:
+        origin = _run_git(["remote", "get-url", "origin"], cwd=repo_path).strip()
+        return Path(origin.rstrip(".git")).stem
+    except RuntimeError:
+        return Path(repo_path).resolve().name
+
+
+@lru_cache(maxsize=None)
 def _detect_language(filename: str) -> Optional[str]:
     """Detect programming language from filename."""
-    basename = Path(filename).name
+    # Plain string slicing — same result as Path(...).name/.suffix without
+    # building a path object for every file of every commit.
+    basename = filename[filename.rfind("/") + 1:]
     if basename in SPECIAL_FILES:
         return SPECIAL_FILES[basename]
-    ext = Path(filename).suffix.lower()
-    return EXTENSION_LANGUAGES.get(ext)
+    dot = basename.rfind(".")
+    if dot <= 0 or dot == len(basename) - 1 or len(basename) - dot > _MAX_EXT_LEN:
+        return None
+    return EXTENSION_LANGUAGES.get(basename[dot:].lower())
 
 
 # ---------------------------------------------------------------------------
 # Statistics
 # ---------------------------------------------------------------------------
 
-def _calculate_streaks(stats: WrappedStats, all_dates: Set[str]) -> None:
-    if not all_dates:
-        return
+@dataclass
+class _CommitTotals:
+    """Tallies collected by one pass over the parsed commits."""
+    # Fixed-size histograms indexed by hour, weekday and month (index 0 unused)
+    commits_by_hour: List[int] = field(default_factory=lambda: [0] * 24)
+    commits_by_weekday: List[int] = field(default_factory=lambda: [0] * 7)
+    commits_by_month: List[int] = field(default_factory=lambda: [0] * 13)
+    daily_counts: Counter = field(default_factory=Counter)
+    authors: Counter = field(default_factory=Counter)
+    files: Counter = field(default_factory=Counter)
+    languages: Counter = field(default_factory=Counter)
+    insertions: int = 0
+    deletions: int = 0
+    files_changed: int = 0
+    msg_chars: int = 0
+    shortest_message: str = ""
+    longest_message: str = ""
+    # (Unix time, ISO date) of the earliest and latest commit
+    first_commit: Tuple[int, str] = (sys.maxsize, "")
+    last_commit: Tuple[int, str] = (-sys.maxsize, "")
 
-    date_objects = sorted(
-        datetime.strptime(d, "%Y-%m-%d").date() for d in all_dates
+
+def _reduce_commits(commits: List[Commit]) -> _CommitTotals:
+    """Tally every parsed commit into one set of totals.
+
+    Works column by column: each field is pulled out with map() and tallied
+    with Counter/sum/min/max, so no Python-level loop runs per commit.
+    """
+    totals = _CommitTotals()
+    if not commits:
+        return totals
+
+    # Slice "YYYY-MM-DDTHH:MM:SS±HH:MM" directly instead of building datetimes
+    dates = list(map(attrgetter("date"), commits))
+    totals.daily_counts.update(map(itemgetter(slice(0, 10)), dates))
+    for hour, n in Counter(map(itemgetter(slice(11, 13)), dates)).items():
+        totals.commits_by_hour[int(hour)] = n
+    for month, n in Counter(map(itemgetter(slice(5, 7)), dates)).items():
+        totals.commits_by_month[int(month)] = n
+    # Weekday once per distinct day, weighted by that day's commit count
+    for ds, n in totals.daily_counts.items():
+        weekday = date_type(int(ds[:4]), int(ds[5:7]), int(ds[8:10])).weekday()
+        totals.commits_by_weekday[weekday] += n
+
+    by_time = attrgetter("timestamp")
+    first = min(commits, key=by_time)
+    last = max(commits, key=by_time)
+    totals.first_commit = (first.timestamp, first.date)
+    totals.last_commit = (last.timestamp, last.date)
+
+    totals.authors.update(map(attrgetter("author"), commits))
+
+    # First shortest and last longest, as a stable sort by length would give
+    messages = list(map(attrgetter("message"), commits))
+    totals.msg_chars = sum(map(len, messages))
+    totals.shortest_message = min(messages, key=len)
+    totals.longest_message = max(reversed(messages), key=len)
+
+    # File stats over one flat list of (adds, dels, path) rows
+    changes = list(chain.from_iterable(map(attrgetter("files"), commits)))
+    totals.files.update(map(itemgetter(2), changes))
+    totals.insertions = sum(map(itemgetter(0), changes))
+    totals.deletions = sum(map(itemgetter(1), changes))
+    totals.files_changed = len(changes)
+
+    # Commits parsed from --shortstat carry totals instead of file rows
+    summaries = list(filter(None, map(attrgetter("summary"), commits)))
+    if summaries:
+        totals.files_changed += sum(map(itemgetter(0), summaries))
+        totals.insertions += sum(map(itemgetter(1), summaries))
+        totals.deletions += sum(map(itemgetter(2), summaries))
+
+    # Total churn per path first, so each distinct path is classified once
+    churn: Counter = Counter()
+    for adds, dels, fname in changes:
+        churn[fname] += adds + dels
+    for fname, lines in churn.items():
+        lang = _detect_language(fname.decode("utf-8", "replace"))
+        if lang:
+            totals.languages[lang] += lines
+
+    return totals
+
+
+def _calculate_streaks(stats: WrappedStats, all_dates: Iterable[str]) -> None:
+    # Day ordinals straight from the "YYYY-MM-DD" keys — no strptime needed
+    ordinals = sorted(
+        date_type(int(d[:4]), int(d[5:7]), int(d[8:10])).toordinal()
+        for d in all_dates
     )
+    if not ordinals:
+        return
 
     # Longest streak
     longest = current = 1
-    for i in range(1, len(date_objects)):
-        if (date_objects[i] - date_objects[i - 1]).days == 1:
+    for prev, day in zip(ordinals, ordinals[1:]):
+        if day - prev == 1:
             current += 1
-            longest = max(longest, current)
+            if current > longest:
+                longest = current
         else:
             current = 1
     stats.longest_streak = longest
 
     # Current streak (from today backwards)
-    today = date_type.today()
+    active = set(ordinals)
     streak = 0
-    check = today
+    check = date_type.today().toordinal()
     # Allow a 1‑day gap (today might not have commits yet)
-    if check.strftime("%Y-%m-%d") not in all_dates:
-        check -= timedelta(days=1)
-    while check.strftime("%Y-%m-%d") in all_dates:
+    if check not in active:
+        check -= 1
+    while check in active:
         streak += 1
-        check -= timedelta(days=1)
+        check -= 1
     stats.current_streak = streak
 
 
@@ -397,6 +607,59 @@ def _determine_personality(stats: WrappedStats, commits: List[Commit]) -> None:
     stats.traits = traits[:6]
 
 
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+def _cache_dir() -> Path:
+    """Per-user cache directory, following each platform's convention."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "git-wrapped"
+
+
+def _cache_path(
+    repo_path: str, year: Optional[int], author: Optional[str], detailed: bool
+) -> Path:
+    # One file per repo and filter set, overwritten as HEAD moves
+    key = f"{Path(repo_path).resolve()}|{year}|{author}|{detailed}"
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return _cache_dir() / f"{digest}.pkl"
+
+
+def _load_cached(path: Path, fingerprint: Tuple[str, ...]) -> Optional[WrappedStats]:
+    """Return cached stats if they were computed for the same fingerprint.
+
+    The fingerprint is (HEAD sha, tool version, today's date): new commits
+    or an upgrade invalidate the entry, and so does a new day, since the
+    current streak is counted back from today.
+    """
+    try:
+        with open(path, "rb") as fh:
+            cached_fingerprint, stats = pickle.load(fh)
+    except Exception:
+        # Missing, unreadable or stale-format cache — just recompute
+        return None
+    if cached_fingerprint != fingerprint or not isinstance(stats, WrappedStats):
+        return None
+    return stats
+
+
+def _store_cached(path: Path, fingerprint: Tuple[str, ...], stats: WrappedStats) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as fh:
+            pickle.dump((fingerprint, stats), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # caching is best-effort
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -405,17 +668,48 @@ def analyze(
     repo_path: str = ".",
     year: Optional[int] = None,
     author: Optional[str] = None,
+    detailed: bool = True,
+    use_cache: bool = True,
 ) -> WrappedStats:
-    """Analyze a git repository and return WrappedStats."""
+    """Analyze a git repository and return WrappedStats.
+
+    Pass ``detailed=False`` to skip per-file stats (top files, languages)
+    for a faster run on large repositories. Results are cached on disk per
+    repo and filter set, and reused while HEAD has not moved (see
+    ``_load_cached``); pass ``use_cache=False`` to always recompute.
+    """
+    if not use_cache:
+        return _compute_stats(repo_path, year, author, detailed)
 
-    # Resolve repo name
     try:
-        origin = _run_git(["remote", "get-url", "origin"], cwd=repo_path).strip()
-        repo_name = Path(origin.rstrip(".git")).stem
+        head = _run_git(["rev-parse", "HEAD"], cwd=repo_path).strip()
     except RuntimeError:
-        repo_name = Path(repo_path).resolve().name
+        # No commits or not a repo — let the normal path report it
+        return _compute_stats(repo_path, year, author, detailed)
+
+    path = _cache_path(repo_path, year, author, detailed)
+    fingerprint = (head, __version__, date_type.today().isoformat())
+    stats = _load_cached(path, fingerprint)
+    if stats is None:
+        stats = _compute_stats(repo_path, year, author, detailed)
+        _store_cached(path, fingerprint, stats)
+    return stats
+
+
+def _compute_stats(
+    repo_path: str,
+    year: Optional[int],
+    author: Optional[str],
+    detailed: bool,
+) -> WrappedStats:
+    # Resolve the repo name in the background so git log starts right away
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        repo_name_future = pool.submit(_resolve_repo_name, repo_path)
+        commits = parse_git_log(
+            repo_path, year=year, author=author, detailed=detailed
+        )
+        repo_name = repo_name_future.result()
 
-    commits = parse_git_log(repo_path, year=year, author=author)
     if not commits:
         raise ValueError(
             "No commits found. Check --year and --author filters, "
@@ -425,42 +719,29 @@ def analyze(
     stats = WrappedStats(repo_name=repo_name, year=year)
     stats.total_commits = len(commits)
 
-    file_counter: Counter = Counter()
-    lang_counter: Counter = Counter()
-    msg_lengths: List[Tuple[int, str]] = []
-    all_dates: Set[str] = set()
-    author_counter: Counter = Counter()
-
-    for commit in commits:
-        stats.commits_by_hour[commit.date.hour] += 1
-        stats.commits_by_weekday[commit.date.weekday()] += 1
-        stats.commits_by_month[commit.date.month] += 1
-
-        ds = commit.date.strftime("%Y-%m-%d")
-        stats.daily_counts[ds] += 1
-        all_dates.add(ds)
+    totals = _reduce_commits(commits)
 
-        author_counter[commit.author] += 1
-
-        for adds, dels, fname in commit.files:
-            stats.total_insertions += adds
-            stats.total_deletions += dels
-            file_counter[fname] += 1
-
-            lang = _detect_language(fname)
-            if lang:
-                lang_counter[lang] += adds + dels
-
-        stats.total_files_changed += len(commit.files)
-        msg_lengths.append((len(commit.message), commit.message))
+    stats.commits_by_hour.update(dict(enumerate(totals.commits_by_hour)))
+    stats.commits_by_weekday.update(dict(enumerate(totals.commits_by_weekday)))
+    stats.commits_by_month.update(dict(enumerate(totals.commits_by_month[1:], start=1)))
+    stats.daily_counts = totals.daily_counts
+    stats.total_insertions = totals.insertions
+    stats.total_deletions = totals.deletions
+    stats.total_files_changed = totals.files_changed
+    file_counter = totals.files
+    lang_counter = totals.languages
+    author_counter = totals.authors
 
     # Dates
-    stats.first_commit = min(c.date for c in commits)
-    stats.last_commit = max(c.date for c in commits)
-    stats.active_days = len(all_dates)
+    stats.first_commit = datetime.fromisoformat(totals.first_commit[1])
+    stats.last_commit = datetime.fromisoformat(totals.last_commit[1])
+    stats.active_days = len(stats.daily_counts)
 
     # Top files
-    stats.top_files = file_counter.most_common(10)
+    stats.top_files = [
+        (fname.decode("utf-8", "replace").translate(_PATH_ESCAPES), count)
+        for fname, count in file_counter.most_common(10)
+    ]
 
     # Languages
     stats.languages = dict(lang_counter.most_common(10))
@@ -469,24 +750,30 @@ def analyze(
     stats.authors = dict(author_counter.most_common(10))
 
     # Messages
-    if msg_lengths:
-        msg_lengths.sort(key=lambda x: x[0])
-        stats.shortest_message = msg_lengths[0][1]
-        stats.longest_message = msg_lengths[-1][1]
-        stats.avg_message_length = sum(m[0] for m in msg_lengths) / len(msg_lengths)
+    stats.shortest_message = totals.shortest_message
+    stats.longest_message = totals.longest_message
+    stats.avg_message_length = totals.msg_chars / stats.total_commits
 
     # Busiest day
     if stats.daily_counts:
         bd = max(stats.daily_counts.items(), key=lambda x: x[1])
         stats.busiest_day = bd
 
-    # Most productive month
+    # Most productive month (ties go to the month committed to most recently)
     if stats.commits_by_month:
-        best_month = max(stats.commits_by_month, key=stats.commits_by_month.get)  # type: ignore[arg-type]
+        latest_day: Dict[int, str] = {}
+        for ds in stats.daily_counts:
+            month = int(ds[5:7])
+            if ds > latest_day.get(month, ""):
+                latest_day[month] = ds
+        best_month, _ = max(
+            stats.commits_by_month.items(),
+            key=lambda x: (x[1], latest_day.get(x[0], "")),
+        )
         stats.most_productive_month = MONTH_NAMES[best_month]
 
     # Streaks
-    _calculate_streaks(stats, all_dates)
+    _calculate_streaks(stats, stats.daily_counts.keys())
 
     # Holidays
     stats.holiday_commits = _detect_holidays(stats.daily_counts)
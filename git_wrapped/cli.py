@@ -32,10 +32,27 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Filter by author name or email (supports partial match)",
     )
+    parser.add_argument(
+        "--animate",
+        action="store_true",
+        help="Reveal the report section by section with short pauses",
+    )
+    # Animation used to be on by default; keep the old opt-out working
     parser.add_argument(
         "--no-animate",
+        action="store_false",
+        dest="animate",
+        help=argparse.SUPPRESS,
+    )
+    parser.add_argument(
+        "--no-files",
+        action="store_true",
+        help="Skip per-file stats (top files, languages) for a faster run on large repos",
+    )
+    parser.add_argument(
+        "--no-cache",
         action="store_true",
-        help="Disable loading animation and section pauses",
+        help="Recompute stats instead of reusing cached results for this HEAD",
     )
     parser.add_argument(
         "--json",
@@ -99,13 +116,19 @@ def main() -> None:
     if args.compare:
         y1, y2 = args.compare
         try:
-            stats1 = analyze(repo_path=repo_path, year=y1, author=args.author)
-            stats2 = analyze(repo_path=repo_path, year=y2, author=args.author)
+            stats1 = analyze(
+                repo_path=repo_path, year=y1, author=args.author,
+                detailed=not args.no_files, use_cache=not args.no_cache,
+            )
+            stats2 = analyze(
+                repo_path=repo_path, year=y2, author=args.author,
+                detailed=not args.no_files, use_cache=not args.no_cache,
+            )
         except (RuntimeError, ValueError) as exc:
             print(f"Error: {exc}", file=sys.stderr)
             sys.exit(1)
         from git_wrapped.display import display_compare
-        display_compare(stats1, stats2, animate=not args.no_animate)
+        display_compare(stats1, stats2, animate=args.animate)
         return
 
     # Normal single-year mode
@@ -114,6 +137,8 @@ def main() -> None:
             repo_path=repo_path,
             year=args.year,
             author=args.author,
+            detailed=not args.no_files,
+            use_cache=not args.no_cache,
         )
     except (RuntimeError, ValueError) as exc:
         print(f"Error: {exc}", file=sys.stderr)
@@ -129,4 +154,4 @@ def main() -> None:
         return
 
     from git_wrapped.display import display_wrapped
-    display_wrapped(stats, animate=not args.no_animate)
+    display_wrapped(stats, animate=args.animate)
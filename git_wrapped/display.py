@@ -1,17 +1,18 @@
 """Beautiful terminal display for git-wrapped using Rich."""
 
 import time
-from typing import Dict, List, Tuple, Optional
+from datetime import date
+from itertools import groupby
+from typing import Dict, Optional
 
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 from rich.columns import Columns
 from rich.align import Align
 from rich import box
-from rich.style import Style
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+from rich.style import Style, StyleType
 
 from git_wrapped.analyzer import WrappedStats, MONTH_NAMES
 
@@ -35,6 +36,23 @@ HEATMAP_COLORS = [
     "rgb(57,211,83)",    # 4 — high activity
 ]
 
+# Narrowest heatmap worth drawing; below this the section is skipped
+HEATMAP_MIN_WEEKS = 8
+
+# Bar colors for the language breakdown, cycled in order
+LANGUAGE_COLORS = [
+    "bright_cyan", "bright_green", "bright_magenta", "bright_yellow",
+    "bright_red", "bright_blue", "cyan", "green", "magenta", "yellow",
+]
+
+# Pre-parsed styles for the per-cell / per-bar hot paths
+DIM_STYLE = Style.parse(DIM)
+ACCENT2_STYLE = Style.parse(ACCENT2)
+ACCENT3_STYLE = Style.parse(ACCENT3)
+HEATMAP_STYLES = [Style.parse(c) for c in HEATMAP_COLORS]
+LANGUAGE_STYLES = [Style.parse(c) for c in LANGUAGE_COLORS]
+LANGUAGE_LABEL_STYLES = [Style.parse(f"bold {c}") for c in LANGUAGE_COLORS]
+
 WEEKDAY_LABELS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 HOUR_LABELS = [
     "12am", " 1am", " 2am", " 3am", " 4am", " 5am",
@@ -53,16 +71,32 @@ MONTH_SHORT = [
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _bar(value: int, max_value: int, width: int = 30, color: str = ACCENT) -> Text:
+def _bar(value: int, max_value: int, width: int = 30, color: StyleType = ACCENT) -> Text:
     """Render a horizontal bar chart segment."""
     if max_value == 0:
         filled = 0
     else:
         filled = round(value / max_value * width)
-    bar_text = Text()
-    bar_text.append("█" * filled, style=color)
-    bar_text.append("░" * (width - filled), style=DIM)
-    return bar_text
+    return Text.assemble(("█" * filled, color), ("░" * (width - filled), DIM_STYLE))
+
+
+def _bar_table(label_width: int, value_width: int, label_style: str = DIM, value_justify: str = "left") -> Table:
+    """Borderless label | bar | value grid used by the bar-chart sections.
+
+    Every column gets a 2-space gutter on its left and none on its right,
+    so a row is exactly as wide as _bar_width() budgets for.
+    """
+    table = Table(show_header=False, box=None, padding=(0, 0, 0, 2))
+    table.add_column(style=label_style, width=label_width, no_wrap=True)
+    table.add_column(no_wrap=True)
+    table.add_column(style=DIM, justify=value_justify, width=value_width, no_wrap=True)
+    return table
+
+
+def _bar_width(term_width: int, label_width: int, value_width: int, preferred: int) -> int:
+    """Widest bar, up to *preferred*, that keeps a _bar_table row inside a panel."""
+    # Panel border and padding (4) plus the three column gutters (6)
+    return max(1, min(preferred, term_width - 10 - label_width - value_width))
 
 
 def _compact_number(n: int) -> str:
@@ -82,7 +116,7 @@ def _section_pause(animate: bool) -> None:
 # Sections
 # ---------------------------------------------------------------------------
 
-def _render_header(console: Console, stats: WrappedStats) -> None:
+def _render_header(stats: WrappedStats) -> Optional[RenderableType]:
     year_str = str(stats.year) if stats.year else "All Time"
     title_text = Text()
     title_text.append("  G I T   W R A P P E D  ", style="bold bright_white")
@@ -97,11 +131,13 @@ def _render_header(console: Console, stats: WrappedStats) -> None:
         style="bright_green",
         padding=(1, 4),
     )
-    console.print()
-    console.print(panel)
+    return panel
 
 
-def _render_overview(console: Console, stats: WrappedStats) -> None:
+def _render_overview(stats: WrappedStats) -> Optional[RenderableType]:
+    if not stats.total_commits:
+        return None
+
     net = stats.total_insertions - stats.total_deletions
     net_str = f"+{net:,}" if net >= 0 else f"{net:,}"
     net_color = "green" if net >= 0 else "red"
@@ -122,95 +158,72 @@ def _render_overview(console: Console, stats: WrappedStats) -> None:
     table.add_row("Net Impact", f"[{net_color}]{net_str} lines[/{net_color}]")
     table.add_row("Active Days", f"{stats.active_days:,}{days_span}")
 
-    console.print(Panel(
+    return Panel(
         table,
         title="[bold]The Numbers[/bold]",
         title_align="left",
         border_style=ACCENT,
         padding=(1, 2),
-    ))
+    )
 
 
-def _render_heatmap(console: Console, stats: WrappedStats) -> None:
+def _render_heatmap(stats: WrappedStats, term_width: int) -> Optional[RenderableType]:
     """Render a GitHub-style contribution heatmap (max 52 weeks)."""
     if not stats.daily_counts:
-        return
-
-    from datetime import datetime, timedelta
+        return None
 
-    # Determine available width and max weeks
-    term_width = console.width or 80
+    # Determine max weeks from the available width
     # Account for panel border (2), padding (4), day label (4)
     usable = term_width - 10
+    if usable < HEATMAP_MIN_WEEKS:
+        return None
     MAX_WEEKS = min(52, usable)  # 1 char per week cell
 
+    # Work on proleptic ordinals, where (ordinal - 1) % 7 is the weekday
+    # (Monday=0), instead of stepping and formatting one date per day
+    counts_by_ord = {
+        date.fromisoformat(ds).toordinal(): count
+        for ds, count in stats.daily_counts.items()
+    }
+
     # Determine date range
     if stats.year:
-        start = datetime(stats.year, 1, 1)
-        end = datetime(stats.year, 12, 31)
+        start_ord = date(stats.year, 1, 1).toordinal()
+        end_ord = date(stats.year, 12, 31).toordinal()
     else:
-        all_dates = sorted(stats.daily_counts.keys())
-        end = datetime.strptime(all_dates[-1], "%Y-%m-%d")
-        start = end - timedelta(weeks=MAX_WEEKS)
-
-    # Align start to Monday
-    while start.weekday() != 0:
-        start -= timedelta(days=1)
-    # Align end to Sunday
-    while end.weekday() != 6:
-        end += timedelta(days=1)
-
-    # Build grid: rows=7 (Mon-Sun), cols=weeks
-    max_count = max(stats.daily_counts.values()) if stats.daily_counts else 1
-    thresholds = [0, max_count * 0.25, max_count * 0.50, max_count * 0.75]
-
-    weeks: List[List[Tuple[int, str]]] = []
-    current_week: List[Tuple[int, str]] = []
-    d = start
-
-    month_markers: List[Tuple[int, str]] = []
+        end_ord = max(counts_by_ord)
+        start_ord = end_ord - 7 * MAX_WEEKS
+
+    # Align start to Monday and end to Sunday
+    start_ord -= (start_ord - 1) % 7
+    end_ord += 6 - (end_ord - 1) % 7
+
+    # Build grid: color bucket of every day, Monday-aligned, so that day row
+    # r (Mon-Sun) is the stride-7 slice cells[r::7]. The bucket is
+    # ceil(4 * count / max) — 0 for no activity, then 1-4 for up to
+    # 25/50/75/100% of the busiest day.
+    max_count = max(counts_by_ord.values())
+    buckets = {count: -(-4 * count // max_count) for count in set(counts_by_ord.values())}
+    buckets[0] = 0
+    cells = [buckets[counts_by_ord.get(o, 0)] for o in range(start_ord, end_ord + 1)]
+    week_starts = range(start_ord, end_ord + 1, 7)
+
+    # Week index -> label of the month that week starts in
+    month_markers: Dict[int, str] = {}
     prev_month = -1
-
-    while d <= end:
-        ds = d.strftime("%Y-%m-%d")
-        count = stats.daily_counts.get(ds, 0)
-        current_week.append((count, ds))
-
-        if d.weekday() == 0 and d.month != prev_month:
-            month_markers.append((len(weeks), MONTH_SHORT[d.month]))
-            prev_month = d.month
-
-        if d.weekday() == 6:
-            weeks.append(current_week)
-            current_week = []
-        d += timedelta(days=1)
-
-    if current_week:
-        # Pad to full week
-        while len(current_week) < 7:
-            current_week.append((0, ""))
-        weeks.append(current_week)
-
-    # Color mapping
-    def _color_for(count: int) -> str:
-        if count == 0:
-            return HEATMAP_COLORS[0]
-        if count <= thresholds[1]:
-            return HEATMAP_COLORS[1]
-        if count <= thresholds[2]:
-            return HEATMAP_COLORS[2]
-        if count <= thresholds[3]:
-            return HEATMAP_COLORS[3]
-        return HEATMAP_COLORS[4]
+    for wi, week_ord in enumerate(week_starts):
+        month = date.fromordinal(week_ord).month
+        if month != prev_month:
+            month_markers[wi] = MONTH_SHORT[month]
+            prev_month = month
 
     # Month label row — place abbreviated month at the week it starts
     month_row = Text()
     month_row.append("    ")  # padding for day labels
-    marker_dict = dict(month_markers)
     col = 0
-    for wi in range(len(weeks)):
-        if wi in marker_dict and col <= wi:
-            label = marker_dict[wi][:3]
+    for wi in range(len(week_starts)):
+        if wi in month_markers and col <= wi:
+            label = month_markers[wi]
             month_row.append(label, style="dim white")
             col = wi + len(label)
         elif col <= wi:
@@ -227,89 +240,87 @@ def _render_heatmap(console: Console, stats: WrappedStats) -> None:
         else:
             line.append("    ")
 
-        for week in weeks:
-            if row_idx < len(week):
-                count = week[row_idx][0]
-                color = _color_for(count)
-                line.append("\u2588", style=color)
-            else:
-                line.append(" ")
+        # One span per run of same-colored cells rather than one per cell
+        for bucket, run in groupby(cells[row_idx::7]):
+            line.append("\u2588" * len(list(run)), style=HEATMAP_STYLES[bucket])
         lines.append(line)
 
     # Legend
     legend = Text()
     legend.append("    Less ", style=DIM)
-    for c in HEATMAP_COLORS:
-        legend.append("\u2588", style=c)
+    for style in HEATMAP_STYLES:
+        legend.append("\u2588", style=style)
     legend.append(" More", style=DIM)
     lines.append(Text())
     lines.append(legend)
 
     content = Text("\n").join(lines)
 
-    console.print(Panel(
+    return Panel(
         content,
         title="[bold]Activity Heatmap[/bold]",
         title_align="left",
         border_style=ACCENT2,
         padding=(1, 2),
-    ))
+    )
 
 
-def _render_time_analysis(console: Console, stats: WrappedStats) -> None:
+def _render_time_analysis(stats: WrappedStats, term_width: int) -> Optional[RenderableType]:
     """Bar charts for hour-of-day and day-of-week activity."""
-    max_hour = max(stats.commits_by_hour.values()) if stats.commits_by_hour else 1
+    if not stats.total_commits:
+        return None
+
     max_day = max(stats.commits_by_weekday.values()) if stats.commits_by_weekday else 1
 
     # Hour chart (group into 3-hour blocks for compactness)
+    hours = [stats.commits_by_hour.get(h, 0) for h in range(24)]
     hour_blocks = [
-        ("12-3am", sum(stats.commits_by_hour.get(h, 0) for h in range(0, 3))),
-        (" 3-6am", sum(stats.commits_by_hour.get(h, 0) for h in range(3, 6))),
-        (" 6-9am", sum(stats.commits_by_hour.get(h, 0) for h in range(6, 9))),
-        ("9-12pm", sum(stats.commits_by_hour.get(h, 0) for h in range(9, 12))),
-        ("12-3pm", sum(stats.commits_by_hour.get(h, 0) for h in range(12, 15))),
-        (" 3-6pm", sum(stats.commits_by_hour.get(h, 0) for h in range(15, 18))),
-        (" 6-9pm", sum(stats.commits_by_hour.get(h, 0) for h in range(18, 21))),
-        ("9-12am", sum(stats.commits_by_hour.get(h, 0) for h in range(21, 24))),
+        ("12-3am", sum(hours[0:3])),
+        (" 3-6am", sum(hours[3:6])),
+        (" 6-9am", sum(hours[6:9])),
+        ("9-12pm", sum(hours[9:12])),
+        ("12-3pm", sum(hours[12:15])),
+        (" 3-6pm", sum(hours[15:18])),
+        (" 6-9pm", sum(hours[18:21])),
+        ("9-12am", sum(hours[21:24])),
     ]
     max_block = max(v for _, v in hour_blocks) or 1
 
-    lines = []
-    header = Text("  Hour of Day\n", style=f"bold {ACCENT2}")
-    lines.append(header)
+    # Hours and weekdays share one layout so their bars line up
+    value_width = len(str(max(max_block, max_day)))
+    width = _bar_width(term_width, 6, value_width, preferred=25)
 
+    hour_table = _bar_table(label_width=6, value_width=value_width)
     for label, count in hour_blocks:
-        line = Text()
-        line.append(f"  {label}  ", style=DIM)
-        line.append_text(_bar(count, max_block, width=25, color="bright_cyan"))
-        line.append(f"  {count}", style=DIM)
-        lines.append(line)
-
-    lines.append(Text())
-    lines.append(Text("  Day of Week\n", style=f"bold {ACCENT3}"))
+        hour_table.add_row(label, _bar(count, max_block, width=width, color=ACCENT2_STYLE), str(count))
 
+    day_table = _bar_table(label_width=6, value_width=value_width)
     for day_idx in range(7):
         count = stats.commits_by_weekday.get(day_idx, 0)
-        line = Text()
-        line.append(f"  {WEEKDAY_LABELS[day_idx]}     ", style=DIM)
-        line.append_text(_bar(count, max_day, width=25, color="bright_magenta"))
-        line.append(f"  {count}", style=DIM)
-        lines.append(line)
+        day_table.add_row(
+            WEEKDAY_LABELS[day_idx], _bar(count, max_day, width=width, color=ACCENT3_STYLE), str(count)
+        )
 
-    content = Text("\n").join(lines)
+    content = Group(
+        Text("  Hour of Day\n", style=f"bold {ACCENT2}"),
+        hour_table,
+        Text(),
+        Text("  Day of Week\n", style=f"bold {ACCENT3}"),
+        day_table,
+    )
 
-    console.print(Panel(
+    return Panel(
         content,
         title="[bold]When You Code[/bold]",
         title_align="left",
         border_style=ACCENT3,
         padding=(1, 1),
-    ))
+    )
 
 
-def _render_top_files(console: Console, stats: WrappedStats) -> None:
+def _render_top_files(stats: WrappedStats) -> Optional[RenderableType]:
     if not stats.top_files:
-        return
+        return None
 
     table = Table(show_header=True, header_style=f"bold {ACCENT}", box=box.SIMPLE_HEAVY, padding=(0, 1))
     table.add_column("#", style=DIM, width=3)
@@ -321,49 +332,48 @@ def _render_top_files(console: Console, stats: WrappedStats) -> None:
         rank = medals[i] if i < 3 else f"{i+1}th"
         table.add_row(rank, fname, str(count))
 
-    console.print(Panel(
+    return Panel(
         table,
         title="[bold]Your Top Files[/bold]",
         title_align="left",
         border_style="bright_yellow",
         padding=(1, 1),
-    ))
+    )
 
 
-def _render_languages(console: Console, stats: WrappedStats) -> None:
+def _render_languages(stats: WrappedStats, term_width: int) -> Optional[RenderableType]:
     if not stats.languages:
-        return
+        return None
 
     total = sum(stats.languages.values()) or 1
     max_val = max(stats.languages.values()) or 1
 
-    colors = [
-        "bright_cyan", "bright_green", "bright_magenta", "bright_yellow",
-        "bright_red", "bright_blue", "cyan", "green", "magenta", "yellow",
-    ]
+    label_width = max(12, max(map(len, stats.languages)))
+    width = _bar_width(term_width, label_width, 6, preferred=22)
 
-    lines = []
+    table = _bar_table(label_width=label_width, value_width=6, label_style="", value_justify="right")
     for i, (lang, count) in enumerate(stats.languages.items()):
         pct = count / total * 100
-        color = colors[i % len(colors)]
-        line = Text()
-        line.append(f"  {lang:<14}", style=f"bold {color}")
-        line.append_text(_bar(count, max_val, width=22, color=color))
-        line.append(f"  {pct:5.1f}%", style=DIM)
-        lines.append(line)
-
-    content = Text("\n").join(lines)
+        style_idx = i % len(LANGUAGE_STYLES)
+        table.add_row(
+            Text(lang, style=LANGUAGE_LABEL_STYLES[style_idx]),
+            _bar(count, max_val, width=width, color=LANGUAGE_STYLES[style_idx]),
+            f"{pct:.1f}%",
+        )
 
-    console.print(Panel(
-        content,
+    return Panel(
+        table,
         title="[bold]Languages[/bold]",
         title_align="left",
         border_style="bright_blue",
         padding=(1, 1),
-    ))
+    )
+
 
+def _render_streaks(stats: WrappedStats) -> Optional[RenderableType]:
+    if not stats.total_commits:
+        return None
 
-def _render_streaks(console: Console, stats: WrappedStats) -> None:
     table = Table(show_header=False, box=None, padding=(0, 2))
     table.add_column(style=DIM, width=22)
     table.add_column(style=f"bold {ACCENT}", width=30)
@@ -378,61 +388,51 @@ def _render_streaks(console: Console, stats: WrappedStats) -> None:
     if stats.most_productive_month:
         table.add_row("Best Month", stats.most_productive_month)
 
-    console.print(Panel(
+    return Panel(
         table,
         title="[bold]Streaks & Records[/bold]",
         title_align="left",
         border_style="bright_red",
         padding=(1, 2),
-    ))
+    )
 
 
-def _render_personality(console: Console, stats: WrappedStats) -> None:
-    lines = []
+def _render_personality(stats: WrappedStats) -> Optional[RenderableType]:
+    if not stats.personality:
+        return None
 
     # Big personality reveal
-    you_are = Text()
-    you_are.append("  You are a... ", style=DIM)
-    lines.append(you_are)
-    lines.append(Text())
-
-    big_name = Text()
-    big_name.append(f"    {stats.personality.upper()}", style=f"bold bright_white")
-    big_name.append(f"  {stats.personality_emoji}", style="")
-    lines.append(big_name)
-    lines.append(Text())
-
-    desc = Text()
-    desc.append(f'  "{stats.personality_description}"', style="italic bright_white")
-    lines.append(desc)
+    parts = [
+        ("  You are a... ", DIM), "\n\n",
+        (f"    {stats.personality.upper()}", "bold bright_white"),
+        f"  {stats.personality_emoji}", "\n\n",
+        (f'  "{stats.personality_description}"', "italic bright_white"),
+    ]
 
     if stats.traits:
-        lines.append(Text())
-        lines.append(Text("  Traits:", style=f"bold {ACCENT2}"))
+        parts += ["\n\n", ("  Traits:", f"bold {ACCENT2}")]
         for emoji, trait in stats.traits:
-            t = Text()
-            t.append(f"    {emoji} {trait}", style="bright_white")
-            lines.append(t)
+            parts += ["\n", (f"    {emoji} {trait}", "bright_white")]
 
-    content = Text("\n").join(lines)
+    content = Text.assemble(*parts)
 
-    console.print(Panel(
+    return Panel(
         content,
         title="[bold]Your Coder DNA[/bold]",
         title_align="left",
         border_style=ACCENT3,
         padding=(1, 1),
-    ))
+    )
 
 
-def _render_fun_facts(console: Console, stats: WrappedStats) -> None:
+def _render_fun_facts(stats: WrappedStats) -> Optional[RenderableType]:
     facts = []
 
     if stats.longest_message:
-        msg_preview = stats.longest_message[:60]
-        if len(stats.longest_message) > 60:
-            msg_preview += "..."
-        facts.append(f'  Longest commit message: {len(stats.longest_message)} chars — "{msg_preview}"')
+        msg = stats.longest_message
+        msg_len = len(msg)
+        msg_preview = msg[:60] + ("..." if msg_len > 60 else "")
+        facts.append(f'  Longest commit message: {msg_len} chars — "{msg_preview}"')
 
     if stats.shortest_message:
         facts.append(f'  Shortest commit message: "{stats.shortest_message}"')
@@ -452,97 +452,72 @@ def _render_fun_facts(console: Console, stats: WrappedStats) -> None:
         facts.append(f"  {len(stats.authors)} contributors to this repo")
 
     if not facts:
-        return
+        return None
 
-    lines = [Text(f, style="bright_white") for f in facts]
-    content = Text("\n").join(lines)
+    content = Text("\n".join(facts), style="bright_white")
 
-    console.print(Panel(
+    return Panel(
         content,
         title="[bold]Fun Facts[/bold]",
         title_align="left",
         border_style="bright_yellow",
         padding=(1, 1),
-    ))
-
-
-def _render_footer(console: Console, stats: WrappedStats) -> None:
-    year_str = str(stats.year) if stats.year else "all time"
-    text = Text()
-    text.append(f"\n  Thanks for an amazing {year_str} of coding!", style="bold bright_white")
-    text.append(f"\n  {stats.total_commits:,} commits", style=ACCENT)
-    text.append(" | ", style=DIM)
-    text.append(f"{stats.active_days} active days", style=ACCENT2)
-    text.append(" | ", style=DIM)
-    text.append(f"+{stats.total_insertions:,}/-{stats.total_deletions:,} lines", style=ACCENT3)
-    text.append("\n")
-    console.print(text)
+    )
 
-    share = Text()
-    share.append("  Share your #GitWrapped → ", style=DIM)
-    share.append("git-wrapped --json > my-wrapped.json", style="italic bright_cyan")
-    share.append("\n", style="")
-    console.print(share)
 
+def _render_footer(stats: WrappedStats) -> Optional[RenderableType]:
+    if not stats.total_commits:
+        return None
 
-# ---------------------------------------------------------------------------
-# Loading animation
-# ---------------------------------------------------------------------------
-
-def _show_loading(console: Console) -> None:
-    console.print()
-    with Progress(
-        SpinnerColumn(style=ACCENT),
-        TextColumn("[bold bright_white]Analyzing your git history..."),
-        BarColumn(bar_width=30, style=ACCENT, complete_style="bright_green"),
-        transient=True,
-        console=console,
-    ) as progress:
-        task = progress.add_task("loading", total=100)
-        for i in range(100):
-            time.sleep(0.008)
-            progress.update(task, advance=1)
+    year_str = str(stats.year) if stats.year else "all time"
+    return Text.assemble(
+        (f"\n  Thanks for an amazing {year_str} of coding!", "bold bright_white"),
+        (f"\n  {stats.total_commits:,} commits", ACCENT),
+        (" | ", DIM),
+        (f"{stats.active_days} active days", ACCENT2),
+        (" | ", DIM),
+        (f"+{stats.total_insertions:,}/-{stats.total_deletions:,} lines", ACCENT3),
+        "\n\n",
+        ("  Share your #GitWrapped → ", DIM),
+        ("git-wrapped --json > my-wrapped.json", "italic bright_cyan"),
+        "\n",
+    )
 
 
 # ---------------------------------------------------------------------------
 # Main display
 # ---------------------------------------------------------------------------
 
-def display_wrapped(stats: WrappedStats, animate: bool = True) -> None:
+def display_wrapped(stats: WrappedStats, animate: bool = False) -> None:
     """Render the full Git Wrapped experience to the terminal."""
     console = Console()
 
-    if animate:
-        _show_loading(console)
-
-    _render_header(console, stats)
-    _section_pause(animate)
-
-    _render_overview(console, stats)
-    _section_pause(animate)
-
-    _render_heatmap(console, stats)
-    _section_pause(animate)
-
-    _render_time_analysis(console, stats)
-    _section_pause(animate)
-
-    _render_top_files(console, stats)
-    _section_pause(animate)
-
-    _render_languages(console, stats)
-    _section_pause(animate)
-
-    _render_streaks(console, stats)
-    _section_pause(animate)
-
-    _render_personality(console, stats)
-    _section_pause(animate)
+    # Measure the terminal once; it won't change during a single render
+    term_width = console.width or 80
 
-    _render_fun_facts(console, stats)
-    _section_pause(animate)
+    sections = [
+        _render_header(stats),
+        _render_overview(stats),
+        _render_heatmap(stats, term_width),
+        _render_time_analysis(stats, term_width),
+        _render_top_files(stats),
+        _render_languages(stats, term_width),
+        _render_streaks(stats),
+        _render_personality(stats),
+        _render_fun_facts(stats),
+        _render_footer(stats),
+    ]
+    sections = [section for section in sections if section is not None]
 
-    _render_footer(console, stats)
+    console.print()
+    if animate:
+        for i, section in enumerate(sections):
+            if i:
+                _section_pause(animate)
+            console.print(section)
+    else:
+        # Render everything in one pass rather than one print per panel
+        console.print(Group(*sections))
 
 
 # ---------------------------------------------------------------------------
@@ -561,13 +536,10 @@ def _delta_str(old: int, new: int) -> str:
     return "[dim]0%[/dim]"
 
 
-def display_compare(stats1: WrappedStats, stats2: WrappedStats, animate: bool = True) -> None:
+def display_compare(stats1: WrappedStats, stats2: WrappedStats, animate: bool = False) -> None:
     """Render a side-by-side comparison of two years."""
     console = Console()
 
-    if animate:
-        _show_loading(console)
-
     y1 = str(stats1.year) if stats1.year else "Period 1"
     y2 = str(stats2.year) if stats2.year else "Period 2"
 
@@ -621,25 +593,19 @@ def display_compare(stats1: WrappedStats, stats2: WrappedStats, animate: bool =
     _section_pause(animate)
 
     # Personality comparison
-    lines = []
-    p1 = Text()
-    p1.append(f"  {y1}: ", style=DIM)
-    p1.append(f"{stats1.personality} {stats1.personality_emoji}", style="bold bright_cyan")
-    lines.append(p1)
-
-    p2 = Text()
-    p2.append(f"  {y2}: ", style=DIM)
-    p2.append(f"{stats2.personality} {stats2.personality_emoji}", style="bold bright_magenta")
-    lines.append(p2)
+    parts = [
+        (f"  {y1}: ", DIM),
+        (f"{stats1.personality} {stats1.personality_emoji}", "bold bright_cyan"),
+        "\n",
+        (f"  {y2}: ", DIM),
+        (f"{stats2.personality} {stats2.personality_emoji}", "bold bright_magenta"),
+    ]
 
     if stats1.personality != stats2.personality:
-        lines.append(Text())
-        change = Text()
-        change.append(f"  Your coding personality evolved!", style="italic bright_white")
-        lines.append(change)
+        parts += ["\n\n", ("  Your coding personality evolved!", "italic bright_white")]
 
     console.print(Panel(
-        Text("\n").join(lines),
+        Text.assemble(*parts),
         title="[bold]Personality Shift[/bold]",
         title_align="left",
         border_style=ACCENT3,